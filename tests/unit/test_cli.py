@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file contains pytests for urlextract command line program
+
+.. Licence MIT
+.. codeauthor:: Jan Lipovský <janlipovsky@gmail.com>, janlipovsky.cz
+"""
+import sys
+
+import pytest
+
+from urlextract import URLExtract, _urlextract_cli
+from urlextract import urlextract_core
+
+
+@pytest.fixture
+def input_file(tmp_path, monkeypatch):
+    """Multi-line input file processed by CLI in more chunks"""
+    # CLI should not try to download list of TLDs in tests
+    monkeypatch.setattr(URLExtract, "update_when_older", lambda self, days: True)
+    monkeypatch.setattr(urlextract_core, "TEXT_CHUNK_SIZE", 20)
+
+    path = tmp_path / "input.txt"
+    path.write_text("example.com and example.net\n" * 5 + "janlipovsky.cz\n")
+    return str(path)
+
+
+def run_cli(monkeypatch, capsys, args):
+    monkeypatch.setattr(sys, "argv", ["urlextract"] + args)
+    _urlextract_cli()
+    return capsys.readouterr().out.splitlines()
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        ([], ["example.com", "example.net"] * 5 + ["janlipovsky.cz"]),
+        (["-u"], ["example.com", "example.net", "janlipovsky.cz"]),
+    ],
+)
+def test_cli(input_file, monkeypatch, capsys, args, expected):
+    """
+    Testing CLI printing URLs found in all chunks of input file
+
+    :param fixture input_file: fixture holding path to input file
+    :param list(str) args: command line arguments
+    :param list(str) expected: list of URLs that has to be printed
+    """
+    assert run_cli(monkeypatch, capsys, args + [input_file]) == expected
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        (["-l", "3"], ["example.com", "example.net", "example.com"]),
+        (["-u", "-l", "3"], ["example.com", "example.net"]),
+    ],
+)
+def test_cli_limit(input_file, monkeypatch, capsys, caplog, args, expected):
+    """
+    Testing CLI stopping after limit of URLs was reached
+
+    :param fixture input_file: fixture holding path to input file
+    :param list(str) args: command line arguments
+    :param list(str) expected: list of URLs that has to be printed
+    """
+    assert run_cli(monkeypatch, capsys, args + [input_file]) == expected
+    assert "Limit for extracting URLs was reached" in caplog.text
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file contains pytests for module level functions using shared extractor
+
+.. Licence MIT
+.. codeauthor:: Jan Lipovský <janlipovsky@gmail.com>, janlipovsky.cz
+"""
+import pytest
+
+import urlextract
+
+
+def test_get_default_extractor():
+    """Testing that the same URLExtract object is returned every time"""
+    extractor = urlextract.get_default_extractor()
+    assert isinstance(extractor, urlextract.URLExtract)
+    assert urlextract.get_default_extractor() is extractor
+
+
+@pytest.mark.parametrize(
+    "text, kwargs, expected",
+    [
+        ("Let's have URL example.com as an example.", {}, ["example.com"]),
+        (
+            "example.com and example.com",
+            {"only_unique": True},
+            ["example.com"],
+        ),
+        (
+            "Let's have URL example.com as an example.",
+            {"get_indices": True},
+            [("example.com", (15, 26))],
+        ),
+        (
+            "example.com and https://example.org",
+            {"with_schema_only": True},
+            ["https://example.org"],
+        ),
+    ],
+)
+def test_find_urls(text, kwargs, expected):
+    """
+    Testing module level find_urls function
+
+    :param str text: text in which we should find links
+    :param dict kwargs: arguments passed to find_urls
+    :param list(str) expected: list of URLs that has to be found in text
+    """
+    assert urlextract.find_urls(text, **kwargs) == expected
@@ -6,6 +6,8 @@ Tests for find_url() method of URLExtract with invalid hostnames.
 .. Licence MIT
 .. codeauthor:: John Vandenberg <jayvdb@gmail.com>
 """
+import socket
+
 import pytest
 
 import dns.resolver
@@ -144,6 +146,49 @@ def test_dns_cache_negative(urlextract, dns_resolver):
         assert len(dns_resolver.cache.data) == 2
 
 
+def test_dns_negative_result_cached(urlextract, monkeypatch):
+    """Testing failed lookups are not repeated within negative cache TTL"""
+    lookups = []
+
+    def failing_gethostbyname(host):
+        lookups.append(host)
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+    urlextract._cache_dns = False
+    monkeypatch.setattr(urlextract_core.socket, "gethostbyname", failing_gethostbyname)
+
+    assert urlextract.find_urls("https://example.com", check_dns=True) == []
+    assert urlextract.find_urls("https://example.com", check_dns=True) == []
+    assert lookups == ["example.com"]
+
+    # expired entry is looked up again
+    monkeypatch.setattr(urlextract_core, "DNS_NEGATIVE_CACHE_TTL", 0)
+    assert urlextract.find_urls("https://example.com", check_dns=True) == []
+    assert lookups == ["example.com", "example.com"]
+
+
+def test_dns_negative_cache_size(urlextract, monkeypatch):
+    """Testing only limited count of failed lookups is remembered"""
+
+    def failing_gethostbyname(host):
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+    urlextract._cache_dns = False
+    monkeypatch.setattr(urlextract_core.socket, "gethostbyname", failing_gethostbyname)
+    monkeypatch.setattr(urlextract_core, "DNS_NEGATIVE_CACHE_SIZE", 2)
+
+    for host in ("example.com", "example.net", "example.org"):
+        assert urlextract.find_urls(host, check_dns=True) == []
+    assert list(urlextract._dns_negative_cache) == ["example.net", "example.org"]
+
+    # expired hosts are removed first
+    urlextract._dns_negative_cache[
+        "example.net"
+    ] -= urlextract_core.DNS_NEGATIVE_CACHE_TTL
+    assert urlextract.find_urls("example.com", check_dns=True) == []
+    assert list(urlextract._dns_negative_cache) == ["example.org", "example.com"]
+
+
 @pytest.mark.parametrize(
     "text, expected",
     [
@@ -6,6 +6,8 @@
 """
 import pytest
 
+from urlextract import URLExtract
+
 
 @pytest.mark.parametrize(
     "text, expected",
@@ -97,3 +99,63 @@ def test_remove_enclosure(urlextract):
 
     with pytest.raises(AssertionError):
         urlextract.remove_enclosure("", "")
+
+
+def test_added_enclosure_is_removed(urlextract):
+    text = "*example.com*"
+    assert urlextract.find_urls(text) == []
+
+    urlextract.add_enclosure("*", "*")
+    try:
+        assert urlextract.find_urls(text) == ["example.com"]
+    finally:
+        urlextract.remove_enclosure("*", "*")
+
+    assert urlextract.find_urls(text) == []
+
+
+def test_enclosure_keeps_custom_after_tld_chars(urlextract):
+    after_tld_chars = set(urlextract.get_after_tld_chars()) | {"!"}
+    urlextract.set_after_tld_chars(after_tld_chars)
+
+    urlextract.add_enclosure("*", "*")
+    try:
+        assert set(urlextract.get_after_tld_chars()) == after_tld_chars | {"*"}
+    finally:
+        urlextract.remove_enclosure("*", "*")
+
+    assert set(urlextract.get_after_tld_chars()) == after_tld_chars
+
+    # right character used by other enclosure has to stay
+    urlextract.add_enclosure("<", ")")
+    urlextract.remove_enclosure("<", ")")
+    assert set(urlextract.get_after_tld_chars()) == after_tld_chars
+
+
+def test_without_enclosures(urlextract):
+    enclosures = set(urlextract.get_enclosures())
+    for left_char, right_char in enclosures:
+        urlextract.remove_enclosure(left_char, right_char)
+    try:
+        assert urlextract.find_urls("see example.com/path") == ["example.com/path"]
+    finally:
+        for left_char, right_char in enclosures:
+            urlextract.add_enclosure(left_char, right_char)
+
+    assert urlextract.find_urls("(example.com)") == ["example.com"]
+
+
+def test_enclosure_removed_by_other_object(urlextract):
+    other_urlextract = URLExtract()
+    text = "(example.com/path)"
+    assert urlextract.find_urls(text) == ["example.com/path"]
+
+    # enclosures are shared by all objects
+    other_urlextract.remove_enclosure("(", ")")
+    try:
+        assert ("(", ")") not in urlextract.get_enclosures()
+        assert urlextract.find_urls(text) == other_urlextract.find_urls(text)
+    finally:
+        other_urlextract.add_enclosure("(", ")")
+
+    assert urlextract.find_urls(text) == ["example.com/path"]
@@ -6,8 +6,12 @@ This file contains pytests for find_url() method of URLExtract
 .. Licence MIT
 .. codeauthor:: Jan Lipovský <janlipovsky@gmail.com>, janlipovsky.cz
 """
+import multiprocessing
+
 import pytest
 
+from urlextract import URLExtract
+
 
 @pytest.mark.parametrize(
     "text, expected",
@@ -126,6 +130,19 @@ def test_find_urls_unique(urlextract, text, expected):
                 ("www.company.com", (10, 25)),
             ],
         ),
+        (
+            "127.0.0.1:8080/x example.com 127.0.0.1:8080/x janlipovsky.cz",
+            [
+                ("127.0.0.1:8080/x", (0, 16)),
+                ("example.com", (17, 28)),
+                ("127.0.0.1:8080/x", (29, 45)),
+                ("janlipovsky.cz", (46, 60)),
+            ],
+        ),
+        (
+            "İstanbul Example.COM",
+            [("Example.COM", (9, 20))],
+        ),
     ],
 )
 def test_find_urls_with_indices(urlextract, text, expected):
@@ -187,14 +204,133 @@ def test_find_urls_multiple_protocol(urlextract, text, expected):
         ("test link:job:https://example.com/r", ["https://example.com/r"]),
     ],
 )
-def test_find_urls_multiple_protocol_custom(urlextract, text, expected):
+@pytest.mark.parametrize("in_place", [False, True])
+def test_find_urls_multiple_protocol_custom(urlextract, text, expected, in_place):
     """
     Testing find_urls returning all URLs
 
     :param fixture urlextract: fixture holding URLExtract object
     :param str text: text in which we should find links
     :param list(str) expected: list of URLs that has to be found in text
+    :param bool in_place: change set returned by getter instead of using setter
     """
-    stop_chars = urlextract.get_stop_chars_left_from_scheme() | {"+"}
-    urlextract.set_stop_chars_left_from_scheme(stop_chars)
+    if in_place:
+        urlextract.get_stop_chars_left_from_scheme().add("+")
+    else:
+        stop_chars = urlextract.get_stop_chars_left_from_scheme() | {"+"}
+        urlextract.set_stop_chars_left_from_scheme(stop_chars)
     assert urlextract.find_urls(text) == expected
+
+
+def test_find_urls_stop_chars_left_in_place(urlextract):
+    """
+    Testing find_urls with stop character on left from TLD added in place
+
+    :param fixture urlextract: fixture holding URLExtract object
+    """
+    urlextract.get_stop_chars_left().add("+")
+    assert urlextract.find_urls("a+b.example.com") == ["b.example.com"]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("example.com/a,b", ["example.com/a"]),
+        ("example.com/a]b example.net", ["example.com/a]b", "example.net"]),
+        ("a,b.example.com", ["a,b.example.com"]),
+    ],
+)
+@pytest.mark.parametrize("in_place", [False, True])
+def test_find_urls_stop_chars_right_custom(urlextract, text, expected, in_place):
+    """
+    Testing find_urls with custom stop characters on right from TLD
+
+    :param fixture urlextract: fixture holding URLExtract object
+    :param str text: text in which we should find links
+    :param list(str) expected: list of URLs that has to be found in text
+    :param bool in_place: change set returned by getter instead of using setter
+    """
+    if in_place:
+        urlextract.get_stop_chars_right().add(",")
+    else:
+        stop_chars = urlextract.get_stop_chars_right() | {","}
+        urlextract.set_stop_chars_right(stop_chars)
+    assert urlextract.find_urls(text) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_find_urls_batch(urlextract, workers):
+    """
+    Testing find_urls_batch returning URLs for each text in given order
+
+    :param fixture urlextract: fixture holding URLExtract object
+    :param int workers: number of threads used for processing texts
+    """
+    texts = [
+        "example.com and example.com",
+        "Text without URL",
+        "https://example.org/path (janlipovsky.cz)",
+    ]
+    expected = [
+        ["example.com"],
+        [],
+        ["https://example.org/path", "janlipovsky.cz"],
+    ]
+    assert (
+        urlextract.find_urls_batch(texts, only_unique=True, workers=workers) == expected
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("get_indices", [False, True])
+def test_find_urls_parallel(urlextract, workers, get_indices):
+    """
+    Testing find_urls_parallel returning the same URLs as find_urls
+
+    :param fixture urlextract: fixture holding URLExtract object
+    :param int workers: number of processes used for processing text
+    :param bool get_indices: whether to return indices of URLs
+    """
+    text = (
+        "example.com and example.com\n"
+        "Text without URL\n"
+        "https://example.org/path (janlipovsky.cz)\n"
+        "(example.com/\n"
+        "path)\n"
+    )
+    expected = urlextract.find_urls(text, get_indices=get_indices)
+    assert (
+        urlextract.find_urls_parallel(
+            text, get_indices=get_indices, workers=workers, chunk_size=10
+        )
+        == expected
+    )
+
+
+def test_find_urls_parallel_spawn(urlextract, monkeypatch, tmp_path):
+    """
+    Testing find_urls_parallel keeping ignore list loaded from file
+    in processes which do not inherit memory of parent process
+
+    :param fixture urlextract: fixture holding URLExtract object
+    :param fixture monkeypatch: fixture for restoring class attributes
+    :param fixture tmp_path: fixture holding temporary directory
+    """
+    # loaded ignore list is stored in set shared by all URLExtract objects
+    monkeypatch.setattr(URLExtract, "_ignore_list", set())
+    ignore_file = tmp_path / "ignore.txt"
+    ignore_file.write_text("example.com\n")
+    urlextract.load_ignore_list(str(ignore_file))
+
+    text = "example.com\n" * 10 + "janlipovsky.cz\n"
+    expected = urlextract.find_urls(text)
+    assert expected == ["janlipovsky.cz"]
+    assert (
+        urlextract.find_urls_parallel(
+            text,
+            workers=2,
+            chunk_size=100,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        == expected
+    )
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file contains pytests for _get_host() method of URLExtract
+
+.. Licence MIT
+.. codeauthor:: Jan Lipovský <janlipovsky@gmail.com>, janlipovsky.cz
+"""
+import pytest
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("Example.com", ("Example.com", "example.com")),
+        ("https://Example.com", ("Example.com", "example.com")),
+        ("https://example.com/path?q=1", ("example.com", "example.com")),
+        ("https://example.com?q=1", ("example.com", "example.com")),
+        ("svn+ssh://example.com#top", ("example.com", "example.com")),
+        ("http://example.com:8080/path", ("example.com", "example.com")),
+        ("http://user@example.com/path", ("example.com", "example.com")),
+        ("http://@example.com", ("", "")),
+        ("http://80/path", ("", "")),
+        ("user@example.com", ("", "")),
+        ("http://127.0.0.1/", ("127.0.0.1", "127.0.0.1")),
+        ("http://[::1]/", ("[::1]", "::1")),
+    ],
+)
+def test_get_host(urlextract, url, expected):
+    """
+    Testing _get_host returning host as written in URL and normalized host
+
+    :param fixture urlextract: fixture holding URLExtract object
+    :param str url: URL from which host should be returned
+    :param tuple(str, str) expected: host as in URL and normalized host
+    """
+    assert urlextract._get_host(url) == expected
@@ -25,6 +25,8 @@ import pytest
         ),
         ("www.example.com", ["www.example.com"]),
         ("example.net", ["example.net"]),
+        ("http://127.0.0.1/", []),
+        ("http://127.0.0.2/", ["http://127.0.0.2/"]),
     ],
 )
 def test_ignore_list(urlextract, text, expected):
@@ -35,5 +37,5 @@ def test_ignore_list(urlextract, text, expected):
     :param str text: text in which we should find links
     :param list(str) expected: list of URLs that has to be found in text
     """
-    urlextract.ignore_list = {"example.com", "another-url.com"}
+    urlextract.ignore_list = {"example.com", "another-url.com", "127.0.0.1"}
     assert urlextract.find_urls(text) == expected
@@ -11,6 +11,7 @@ import pytest
     "text, expected",
     [
         ("Local development url http://localhost:8000/", ["http://localhost:8000/"]),
+        ("Local development url HTTP://LocalHost:8000/", ["HTTP://LocalHost:8000/"]),
         ("Some text with localhost in it", []),
     ],
 )
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file contains pytests for compiled regexp of TLDs in URLExtract
+
+.. Licence MIT
+.. codeauthor:: Jan Lipovský <janlipovsky@gmail.com>, janlipovsky.cz
+"""
+from datetime import timedelta
+
+import pytest
+
+from urlextract import urlextract_core
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("example.com", [".com"]),
+        ("example.co", [".co"]),
+        ("example.coop", [".coop"]),
+        ("example.COM", [".COM"]),
+        ("pravda.com.ua", [".com", ".ua"]),
+        ("127.0.0.1", [".0", ".0", ".1"]),
+        ("http://localhost:80", ["localhost"]),
+        ("Text without TLD", []),
+    ],
+)
+def test_tlds_re(urlextract, text, expected):
+    """
+    Testing compiled regexp of TLDs matching the longest TLD
+
+    :param fixture urlextract: fixture holding URLExtract object
+    :param str text: text in which we should find TLDs
+    :param list(str) expected: list of TLDs that has to be found in text
+    """
+    assert urlextract._get_tlds_re().findall(text) == expected
+
+
+def test_tlds_re_reused_when_tlds_not_changed(urlextract, monkeypatch):
+    """
+    Testing that regexp is not compiled again when cache file was modified
+    but list of TLDs is the same
+
+    :param fixture urlextract: fixture holding URLExtract object
+    :param fixture monkeypatch: pytest monkeypatch fixture
+    """
+    tlds_re = urlextract._get_tlds_re()
+    tlds_lower_re = urlextract._tlds_lower_re
+    last_modification = urlextract._get_last_cachefile_modification()
+    monkeypatch.setattr(
+        urlextract,
+        "_get_last_cachefile_modification",
+        lambda: last_modification + timedelta(seconds=1),
+    )
+
+    urlextract._reload_tlds_from_file()
+    assert urlextract._tlds_lower_re is tlds_lower_re
+    assert urlextract._get_tlds_re() is tlds_re
+
+
+def test_tlds_re_cache_keeps_latest(urlextract, monkeypatch):
+    """
+    Testing that only regexp for the latest cache file modification is kept
+
+    :param fixture urlextract: fixture holding URLExtract object
+    :param fixture monkeypatch: pytest monkeypatch fixture
+    """
+    tlds_re_cache = urlextract_core._TLDS_RE_CACHE
+    cache_size = len(tlds_re_cache)
+    last_modification = urlextract._get_last_cachefile_modification()
+    for seconds in range(1, 4):
+        modification = last_modification + timedelta(seconds=seconds)
+        monkeypatch.setattr(
+            urlextract, "_get_last_cachefile_modification", lambda: modification
+        )
+        urlextract._reload_tlds_from_file()
+
+    assert len(tlds_re_cache) == cache_size
+    cache_key = (urlextract._tld_list_path, urlextract._extract_localhost)
+    assert tlds_re_cache[cache_key][0] == modification
+
+
+def test_tlds_re_compiled_when_needed(urlextract):
+    """
+    Testing that case insensitive regexp is used and shared when lowercase
+    text has different length than the original one
+
+    :param fixture urlextract: fixture holding URLExtract object
+    """
+    urlextract._tlds_re = None
+    assert urlextract.find_urls("example.com") == ["example.com"]
+    assert urlextract._tlds_re is None
+
+    assert urlextract.find_urls("İstanbul example.COM") == ["example.COM"]
+    assert urlextract._tlds_re is not None
+    cache_key = (urlextract._tld_list_path, urlextract._extract_localhost)
+    assert urlextract_core._TLDS_RE_CACHE[cache_key][2] is urlextract._tlds_re
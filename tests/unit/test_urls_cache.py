@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file contains pytests for caching results of find_urls() method of URLExtract
+
+.. Licence MIT
+.. codeauthor:: Jan Lipovský <janlipovsky@gmail.com>, janlipovsky.cz
+"""
+import pickle
+
+import pytest
+
+from urlextract import URLExtract
+
+
+@pytest.fixture
+def urlextract_cached():
+    return URLExtract(cache_size=10)
+
+
+def test_find_urls_cached(urlextract_cached):
+    text = "example.com and example.com"
+
+    urls = urlextract_cached.find_urls(text)
+    assert urls == ["example.com", "example.com"]
+    # returned list can be changed without affecting cached result
+    urls.append("example.net")
+    assert urlextract_cached.find_urls(text) == ["example.com", "example.com"]
+    assert urlextract_cached.find_urls(text, only_unique=True) == ["example.com"]
+    assert urlextract_cached.find_urls(text, get_indices=True) == [
+        ("example.com", (0, 11)),
+        ("example.com", (16, 27)),
+    ]
+
+    cache_info = urlextract_cached._find_urls_cached.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 3
+
+
+def test_cache_cleared_by_setter(urlextract_cached):
+    text = "example.com and janlipovsky.cz"
+    assert urlextract_cached.find_urls(text) == ["example.com", "janlipovsky.cz"]
+
+    urlextract_cached.ignore_list = {"example.com"}
+    assert urlextract_cached.find_urls(text) == ["janlipovsky.cz"]
+
+    urlextract_cached.ignore_list.add("janlipovsky.cz")
+    assert urlextract_cached.find_urls(text) == ["janlipovsky.cz"]
+    urlextract_cached.clear_urls_cache()
+    assert urlextract_cached.find_urls(text) == []
+
+
+def test_cache_disabled(urlextract):
+    assert urlextract._find_urls_cached is None
+    assert urlextract.find_urls("example.com") == ["example.com"]
+    # nothing happens when there is no cache
+    urlextract.clear_urls_cache()
+
+
+def test_cache_pickle():
+    extractor = pickle.loads(pickle.dumps(URLExtract(cache_size=2)))
+    assert extractor.find_urls("example.com") == ["example.com"]
+    assert extractor._find_urls_cached.cache_info().hits == 0
+    assert extractor.find_urls("example.com") == ["example.com"]
+    assert extractor._find_urls_cached.cache_info().hits == 1
+
+
+def test_cache_disabled_pickle(urlextract):
+    extractor = pickle.loads(pickle.dumps(urlextract))
+    assert extractor._find_urls_cached is None
+    assert extractor.find_urls("example.com") == ["example.com"]
@@ -1,2 +1,8 @@
-from .urlextract_core import URLExtract, _urlextract_cli, __version__
+from .urlextract_core import (
+    URLExtract,
+    get_default_extractor,
+    find_urls,
+    _urlextract_cli,
+    __version__,
+)
 from .cachefile import CacheFileError
@@ -233,21 +233,19 @@ class CacheFile:
             )
             raise CacheFileError("Cached file is not readable for current user.")
 
-        set_of_tlds: Set[str] = set()
-
         with filelock.FileLock(self._get_cache_lock_file_path()):
             with open(self._tld_list_path, "r") as f_cache_tld:
-                for line in f_cache_tld:
-                    tld = line.strip().lower()
-                    # skip empty lines
-                    if not tld:
-                        continue
-                    # skip comments
-                    if tld[0] == "#":
-                        continue
-
-                    set_of_tlds.add("." + tld)
-                    set_of_tlds.add("." + idna.decode(tld))
+                content = f_cache_tld.read()
+
+        tlds = [line.strip() for line in content.lower().splitlines()]
+        # skip empty lines and comments
+        tlds = [tld for tld in tlds if tld and tld[0] != "#"]
+
+        set_of_tlds: Set[str] = {"." + tld for tld in tlds}
+        # only punycode TLDs differ in their unicode form
+        set_of_tlds.update(
+            "." + idna.decode(tld) for tld in tlds if tld.startswith("xn--")
+        )
 
         return set_of_tlds
 
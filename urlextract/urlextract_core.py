@@ -8,16 +8,26 @@ urlextract_core.py - file with definition of URLExtract class and urlextract cli
 .. codeauthor:: Jan Lipovský <janlipovsky@gmail.com>, janlipovsky.cz
 .. contributors: https://github.com/lipoja/URLExtract/graphs/contributors
 """
-from argparse import Namespace
 import functools
-import ipaddress
 import logging
 import re
 import socket
-from typing import Set, Iterable, Tuple, List, Union, NoReturn, Generator
+from typing import (
+    Dict,
+    Set,
+    Iterable,
+    Tuple,
+    List,
+    Union,
+    NoReturn,
+    Generator,
+    Optional,
+    FrozenSet,
+    cast,
+)
 import string
 import sys
-from collections import OrderedDict
+import time
 from datetime import datetime, timedelta
 
 import uritools  # type: ignore
@@ -30,6 +40,190 @@ __version__ = "1.9.0"
 # default value for maximum count of processed URLs by find_url
 DEFAULT_LIMIT = 10000
 
+# number of seconds for which failed DNS lookup of host is remembered
+DNS_NEGATIVE_CACHE_TTL = 30
+
+# maximum count of hosts with failed DNS lookup which are remembered
+DNS_NEGATIVE_CACHE_SIZE = 10000
+
+# approximate size (in characters) of text chunk processed at once
+# by find_urls_parallel and urlextract cli
+TEXT_CHUNK_SIZE = 1024 * 1024
+
+# compiled regexps of TLDs shared by all instances, key is tuple of
+# (path to cache file, extract localhost), value is tuple of last modification
+# of cache file, TLDs, case insensitive regexp (None until it is needed)
+# and regexp for lowercase text;
+# only regexps for the latest version of cache file are kept
+_TLDS_RE_CACHE: Dict[
+    Tuple[str, bool],
+    Tuple[datetime, FrozenSet[str], Optional["re.Pattern[str]"], "re.Pattern[str]"],
+] = {}
+
+# URLExtract instance shared by module level functions, see get_default_extractor()
+_DEFAULT_EXTRACTOR: Optional["URLExtract"] = None
+
+# URLExtract object used in worker processes of find_urls_parallel
+_WORKER_EXTRACTOR: Optional["URLExtract"] = None
+
+# URL can contain only ASCII characters left from TLD
+_ASCII_CHARS = frozenset(chr(i) for i in range(128))
+
+# compiled regexp for hosts that do not need to be parsed as URI
+_HOST_ONLY_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+
+# compiled regexp for URLs with scheme and plain host (no user info, no port),
+# the host is the first group
+_SIMPLE_URL_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://([A-Za-z0-9._-]+)(?:[/?#]|$)")
+
+# compiled regexp matching IPv4 address in its canonical form
+_IPV4_OCTET = r"(25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])"
+_IPV4_RE = re.compile(r"^{0}(\.{0}){{3}}$".format(_IPV4_OCTET))
+
+
+def _rstrip_pos(text: str, end: int, chars: str) -> int:
+    """
+    Returns position where continuous run of given characters,
+    which ends right before position `end` in text, starts.
+
+    >>> _rstrip_pos("see: http://example.com", 19, "abcdefghijklmnopqrstuvwxyz:/")
+    5
+
+    :param str text: text to search in
+    :param int end: position right after the last character of the run
+    :param str chars: characters the run consists of
+    :return: start position of the run (equal to `end` if there is no run)
+    :rtype: int
+    """
+    # strip only a window in front of end position, so we do not copy
+    # whole (possibly huge) text for every found TLD
+    window = 256
+    while True:
+        start = max(0, end - window)
+        pos = start + len(text[start:end].rstrip(chars))
+        if pos > start or start == 0:
+            return pos
+        window *= 4
+
+
+def _chars_to_regex(chars: Iterable[str]) -> str:
+    r"""
+    Builds regular expression matching one of given characters.
+
+    :param chars: characters that should be matched
+    :return: character class, or regexp that never matches when no chars given
+    :rtype: str
+
+    >>> print(_chars_to_regex({")", "]"}))
+    [\)\]]
+    """
+    chars = "".join(re.escape(char) for char in sorted(chars) if len(char) == 1)
+    return "[{}]".format(chars) if chars else "(?!)"
+
+
+def _tlds_to_trie_regex(tlds: Iterable[str]) -> str:
+    r"""
+    Builds regular expression matching any of given TLDs.
+
+    Common prefixes of TLDs are factored out into a trie, so regex engine
+    does not have to try every TLD on each position in text,
+    e.g. ".co", ".com", ".coop" -> "\.co(?:m|op)?".
+    When more TLDs match on the same position the longest one is matched.
+
+    :param list tlds: list of TLDs
+    :return: regular expression (lowercase, use re.IGNORECASE)
+    :rtype: str
+
+    >>> print(_tlds_to_trie_regex([".co", ".com", ".coop", ".cz"]))
+    \.c(?:o(?:m|op)?|z)
+    """
+    trie: dict = {}
+    for tld in tlds:
+        node = trie
+        for char in tld.lower():
+            node = node.setdefault(char, {})
+        # mark end of TLD
+        node[""] = {}
+
+    def trie_to_regex(node: dict) -> str:
+        alternatives = [
+            re.escape(char) + trie_to_regex(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not alternatives:
+            return ""
+        if len(alternatives) == 1 and "" not in node:
+            return alternatives[0]
+
+        regex = "(?:" + "|".join(alternatives) + ")"
+        # TLD may end here, longer TLDs are tried first
+        if "" in node:
+            regex += "?"
+        return regex
+
+    return trie_to_regex(trie)
+
+
+@functools.lru_cache(maxsize=10000)
+def _split_host(url: str) -> Tuple[str, Optional[str], bool, bool]:
+    """
+    Returns host of given URL as it is written in URL and normalized.
+    Result does not depend on settings of URLExtract, so it is cached.
+
+    :param str url: URL from which we want to get host
+    :return: tuple of host as it is in URL, normalized host (lowercase,
+        decoded, empty string when URL does not contain host, None when
+        the host is not valid), flag if URL is probably email (it contains
+        user info but not schema) and flag if that email has other parts
+        (port, path, query or fragment)
+    :rtype: tuple(str, str|None, bool, bool)
+    """
+    scheme_pos = url.find("://")
+    if scheme_pos == -1:
+        if _HOST_ONLY_RE.match(url):
+            # URL is just a hostname, no need to parse it
+            return url, url.lower(), False, False
+        url = "http://" + url
+        added_schema = True
+    else:
+        simple_url = _SIMPLE_URL_RE.match(url)
+        # uritools takes authority made only of digits as port
+        if simple_url and not simple_url.group(1).isdigit():
+            # host of URL is plain hostname, no need to parse whole URL
+            url_host = simple_url.group(1)
+            return url_host, url_host.lower(), False, False
+        added_schema = False
+
+    url_parts = uritools.urisplit(url)
+    # <scheme>://<authority>/<path>?<query>#<fragment>
+
+    # authority can't start with @
+    if url_parts.authority and url_parts.authority.startswith("@"):
+        return "", "", False, False
+
+    # if URI contains user info and schema was automatically added
+    # the url is probably an email
+    is_email = bool(url_parts.getuserinfo()) and added_schema
+    email_has_other_parts = is_email and bool(
+        url_parts.getport()
+        or url_parts.getpath()
+        or url_parts.getquery()
+        or url_parts.getfragment()
+    )
+
+    try:
+        host = url_parts.gethost()
+    except ValueError:
+        return "", None, is_email, email_has_other_parts
+
+    if not host:
+        return "", "", is_email, email_has_other_parts
+
+    # gethost() returns ipaddress object for IP literals,
+    # work with its string form only
+    return url_parts.host or "", str(host), is_email, email_has_other_parts
+
 
 class URLExtract(CacheFile):
     """
@@ -68,7 +262,21 @@ class URLExtract(CacheFile):
         ("`", "`"),
     }
 
-    _ipv4_tld = [".{}".format(ip) for ip in reversed(range(256))]
+    # characters that are allowed to be right after TLD by default,
+    # right enclosure characters are allowed as well
+    _default_after_tld_chars = frozenset(string.whitespace) | {
+        "/",
+        '"',
+        "'",
+        "<",
+        ">",
+        "?",
+        ":",
+        ".",
+        ",",
+    }
+
+    _ipv4_tld = frozenset(".{}".format(ip) for ip in range(256))
     _ignore_list: Set[str] = set()
     _permit_list: Set[str] = set()
 
@@ -81,6 +289,7 @@ class URLExtract(CacheFile):
         extract_localhost=True,
         limit=DEFAULT_LIMIT,
         allow_mixed_case_hostname=True,
+        cache_size=0,
         **kwargs,  # noqa E999
     ):
         """
@@ -101,15 +310,24 @@ class URLExtract(CacheFile):
         :param bool allow_mixed_case_hostname: True if hostname can contain mixed case letters
             (upper-case and lower-case).
             Disabled by default
+        :param int cache_size: maximum count of texts for which results
+            of find_urls are cached, see clear_urls_cache().
+            Disabled by default (0)
         """
         super(URLExtract, self).__init__(**kwargs)
 
+        # results of find_urls for recently processed texts
+        self._cache_size = cache_size
+        self._create_urls_cache()
+
         self._tlds_re = None
         self._extract_localhost = extract_localhost
         self._extract_email = extract_email
         self._cache_dns = cache_dns
         self._limit = limit
         self._allow_mixed_case_hostname = allow_mixed_case_hostname
+        # hosts which could not be resolved and time of the failed lookup
+        self._dns_negative_cache: Dict[str, float] = {}
         self._reload_tlds_from_file()
 
         # general stop characters
@@ -120,38 +338,164 @@ class URLExtract(CacheFile):
 
         # default stop characters on left side from schema
         self._stop_chars_left_from_schema = self._stop_chars_left.copy() | {":"}
+        self._update_allowed_chars_left()
 
         # defining default stop chars left
         self._stop_chars_right = set(string.whitespace)
         self._stop_chars_right |= general_stop_chars
+        self._update_stop_chars_right_re()
 
+        self._update_enclosures()
         # characters that are allowed to be right after TLD
         self._after_tld_chars = self._get_after_tld_chars()
 
+    def __getstate__(self):
+        """Return state for pickle, needed by find_urls_parallel"""
+        state = self.__dict__.copy()
+        # sets which could be shared by all objects (class attributes) are
+        # not in __dict__, copy them so they are not lost in new process
+        state["_enclosure"] = set(self._enclosure)
+        state["_ignore_list"] = set(self._ignore_list)
+        state["_permit_list"] = set(self._permit_list)
+        # lru_cache around bound method can not be pickled,
+        # it is created again from _cache_size
+        state.pop("_find_urls_cached")
+        return state
+
+    def __setstate__(self, state):
+        """Restore state from pickle"""
+        self.__dict__.update(state)
+        self._create_urls_cache()
+
+    def _create_urls_cache(self):
+        """Create cache of find_urls results when cache size is set"""
+        self._find_urls_cached = None
+        if self._cache_size > 0:
+            self._find_urls_cached = functools.lru_cache(maxsize=self._cache_size)(
+                self._find_urls_tuple
+            )
+
+    def _update_allowed_chars_left(self):
+        """Update strings of characters that can be part of URL on left from TLD"""
+        # only ASCII characters are allowed in authority and schema
+        allowed_chars = _ASCII_CHARS - self._stop_chars_left
+        self._allowed_chars_left = "".join(sorted(allowed_chars))
+        self._allowed_chars_left_from_schema = "".join(
+            sorted(allowed_chars - self._stop_chars_left_from_schema)
+        )
+        # copy of used characters, sets returned by getters can be changed in place
+        self._stop_chars_left_used = frozenset(self._stop_chars_left)
+        self._stop_chars_left_from_schema_used = frozenset(
+            self._stop_chars_left_from_schema
+        )
+
+    def _update_stop_chars_right_re(self):
+        """Update compiled regexp matching stop character on right from TLD"""
+        self._stop_chars_right_re = re.compile(_chars_to_regex(self._stop_chars_right))
+        # copy of used characters, set returned by getter can be changed in place
+        self._stop_chars_right_used = frozenset(self._stop_chars_right)
+
+    def _update_changed_settings(self):
+        """Update data derived from settings changed in place or by other object"""
+        if (
+            self._stop_chars_left != self._stop_chars_left_used
+            or self._stop_chars_left_from_schema
+            != self._stop_chars_left_from_schema_used
+        ):
+            self._update_allowed_chars_left()
+        if self._enclosure != self._enclosure_used:
+            self._update_enclosures()
+        if self._stop_chars_right != self._stop_chars_right_used:
+            self._update_stop_chars_right_re()
+
+    def _update_enclosures(self):
+        """Update mapping of enclosure characters derived from enclosure pairs"""
+        self._enclosure_map = {
+            left_char: right_char for left_char, right_char in self._enclosure
+        }
+        self._right_enclosures = set(self._enclosure_map.values())
+        self._right_enclosures_re = re.compile(_chars_to_regex(self._right_enclosures))
+        # greedy ".*" makes the regexp match the most right left enclosure
+        self._last_left_enclosure_re = re.compile(
+            "(?s).*({})".format(_chars_to_regex(self._enclosure_map.keys()))
+        )
+        # copy of used enclosures, they are shared by all objects
+        # and can be changed by other object
+        self._enclosure_used = frozenset(self._enclosure)
+
     def _get_after_tld_chars(self) -> Set[str]:
         """Initialize after tld characters"""
-        after_tld_chars = set(string.whitespace)
-        after_tld_chars |= {"/", '"', "'", "<", ">", "?", ":", ".", ","}
-        # get left enclosure characters
-        _, right_enclosure = zip(*self._enclosure)
+        after_tld_chars = set(self._default_after_tld_chars)
         # add right enclosure characters to be valid after TLD
         # for correct parsing of URL e.g. (example.com)
-        after_tld_chars |= set(right_enclosure)
+        after_tld_chars |= self._right_enclosures
 
         return after_tld_chars
 
     def _reload_tlds_from_file(self):
         """
         Reloads TLDs from file and compile regexp.
+        Compiled regexp is reused while the list of TLDs does not change.
         :raises: CacheFileError when cached file is not readable for user
         """
 
-        tlds = sorted(self._load_cached_tlds(), key=len, reverse=True)
-        tlds += self._ipv4_tld
+        last_modification = self._get_last_cachefile_modification()
+        cache_key = (self._tld_list_path, self._extract_localhost)
+        cached = _TLDS_RE_CACHE.get(cache_key)
+        if (
+            cached is not None
+            and last_modification is not None
+            and cached[0] == last_modification
+        ):
+            _, _, self._tlds_re, self._tlds_lower_re = cached
+            self.clear_urls_cache()
+            return
+
+        tlds = self._load_cached_tlds() | self._ipv4_tld
         if self._extract_localhost:
-            tlds.append("localhost")
-        re_escaped = [re.escape(str(tld)) for tld in tlds]
-        self._tlds_re = re.compile("|".join(re_escaped), flags=re.IGNORECASE)
+            tlds.add("localhost")
+
+        # file can be modified without changing list of TLDs (e.g. by update)
+        if cached is not None and cached[1] == tlds:
+            _, _, self._tlds_re, self._tlds_lower_re = cached
+        else:
+            # matching lowercase text is faster than case insensitive matching,
+            # case insensitive regexp is compiled only when it is needed
+            self._tlds_re = None
+            self._tlds_lower_re = re.compile(_tlds_to_trie_regex(tlds))
+
+        if last_modification is not None:
+            _TLDS_RE_CACHE[cache_key] = (
+                last_modification,
+                frozenset(tlds),
+                self._tlds_re,
+                self._tlds_lower_re,
+            )
+        self.clear_urls_cache()
+
+    def _get_tlds_re(self) -> "re.Pattern[str]":
+        """
+        Returns case insensitive regexp of TLDs.
+        It is compiled on first use and shared with objects using the same TLDs.
+
+        :return: compiled regexp
+        """
+        if self._tlds_re is not None:
+            return self._tlds_re
+
+        cache_key = (self._tld_list_path, self._extract_localhost)
+        cached = _TLDS_RE_CACHE.get(cache_key)
+        # other object could have compiled it already
+        if cached is not None and cached[3] is self._tlds_lower_re:
+            if cached[2] is None:
+                tlds_re = re.compile(self._tlds_lower_re.pattern, flags=re.IGNORECASE)
+                cached = cached[:2] + (tlds_re, cached[3])
+                _TLDS_RE_CACHE[cache_key] = cached
+            self._tlds_re = cached[2]
+        else:
+            self._tlds_re = re.compile(self._tlds_lower_re.pattern, flags=re.IGNORECASE)
+
+        return self._tlds_re
 
     @property
     def extract_email(self) -> bool:
@@ -170,6 +514,7 @@ class URLExtract(CacheFile):
         :param bool extract: True if emails should be extracted False otherwise
         """
         self._extract_email = extract
+        self.clear_urls_cache()
 
     @property
     def allow_mixed_case_hostname(self) -> bool:
@@ -188,6 +533,7 @@ class URLExtract(CacheFile):
         :param bool allow_mixed_case: True if we should allow mixed case hostnames False otherwise
         """
         self._allow_mixed_case_hostname = allow_mixed_case
+        self.clear_urls_cache()
 
     @property
     def extract_localhost(self) -> bool:
@@ -207,6 +553,7 @@ class URLExtract(CacheFile):
             False otherwise
         """
         self._extract_localhost = enable
+        self.clear_urls_cache()
 
     @property
     def ignore_list(self) -> Set[str]:
@@ -226,6 +573,7 @@ class URLExtract(CacheFile):
         :param set(str) ignore_list: set of URLs
         """
         self._ignore_list = ignore_list
+        self.clear_urls_cache()
 
     def load_ignore_list(self, file_name):
         """
@@ -239,6 +587,7 @@ class URLExtract(CacheFile):
                 if not url:
                     continue
                 self._ignore_list.add(url)
+        self.clear_urls_cache()
 
     @property
     def permit_list(self):
@@ -258,6 +607,7 @@ class URLExtract(CacheFile):
         :param set(str) permit_list: set of URLs
         """
         self._permit_list = permit_list
+        self.clear_urls_cache()
 
     def load_permit_list(self, file_name):
         """
@@ -271,6 +621,7 @@ class URLExtract(CacheFile):
                 if not url:
                     continue
                 self._permit_list.add(url)
+        self.clear_urls_cache()
 
     def update(self):
         """
@@ -336,6 +687,7 @@ class URLExtract(CacheFile):
         """
 
         self._after_tld_chars = set(after_tld_chars)
+        self.clear_urls_cache()
 
     def get_stop_chars_left(self) -> Set[str]:
         """
@@ -361,6 +713,8 @@ class URLExtract(CacheFile):
             )
 
         self._stop_chars_left = stop_chars
+        self._update_allowed_chars_left()
+        self.clear_urls_cache()
 
     def get_stop_chars_left_from_scheme(self) -> Set[str]:
         """
@@ -386,6 +740,8 @@ class URLExtract(CacheFile):
             )
 
         self._stop_chars_left_from_schema = stop_chars
+        self._update_allowed_chars_left()
+        self.clear_urls_cache()
 
     def get_stop_chars_right(self) -> Set[str]:
         """
@@ -411,6 +767,8 @@ class URLExtract(CacheFile):
             )
 
         self._stop_chars_right = stop_chars
+        self._update_stop_chars_right_re()
+        self.clear_urls_cache()
 
     def get_enclosures(self) -> Set[Tuple[str, str]]:
         """
@@ -434,7 +792,9 @@ class URLExtract(CacheFile):
         assert len(right_char) == 1, "Parameter right_char must be character not string"
         self._enclosure.add((left_char, right_char))
 
-        self._after_tld_chars = self._get_after_tld_chars()
+        self._update_enclosures()
+        self._after_tld_chars.add(right_char)
+        self.clear_urls_cache()
 
     def remove_enclosure(self, left_char: str, right_char: str):
         """
@@ -449,7 +809,14 @@ class URLExtract(CacheFile):
         if rm_enclosure in self._enclosure:
             self._enclosure.remove(rm_enclosure)
 
-        self._after_tld_chars = self._get_after_tld_chars()
+        self._update_enclosures()
+        # right character can be still used by other enclosure
+        if (
+            right_char not in self._right_enclosures
+            and right_char not in self._default_after_tld_chars
+        ):
+            self._after_tld_chars.discard(right_char)
+        self.clear_urls_cache()
 
     def _complete_url(
         self, text: str, tld_pos: int, tld: str, check_dns=False, with_schema_only=False
@@ -467,69 +834,44 @@ class URLExtract(CacheFile):
         :rtype: str
         """
 
-        left_ok = True
-        right_ok = True
+        # find start of URL, stop characters are stricter left from schema
+        start_pos = _rstrip_pos(text, tld_pos, self._allowed_chars_left)
+        scheme_pos = text.rfind("://", start_pos, tld_pos)
+        if scheme_pos != -1:
+            start_pos = _rstrip_pos(
+                text, scheme_pos, self._allowed_chars_left_from_schema
+            )
+
+        stop_char = self._stop_chars_right_re.search(text, tld_pos + 1)
+        end_pos = stop_char.start() - 1 if stop_char else len(text) - 1
 
         # hack to fix Markdown link match
-        possible_markdown = False
-        right_enclosure_pos = None
-
-        max_len = len(text) - 1
-        end_pos = tld_pos
-        start_pos = tld_pos
-        in_scheme = False
-        while left_ok or right_ok:
-            if left_ok:
-                if start_pos <= 0:
-                    left_ok = False
-                else:
-                    # For Markdown link is typical to have "](" these
-                    # brackets next to each other without white space
-                    if text[start_pos] == "(" and text[start_pos - 1] == "]":
-                        possible_markdown = True
-                    if (
-                        in_scheme
-                        and text[start_pos - 1] in self._stop_chars_left_from_schema
-                    ):
-                        left_ok = False
-                    if (
-                        left_ok
-                        and text[start_pos - 1] not in self._stop_chars_left
-                        # Allow only ASCII characters in authority and schema
-                        and ord(text[start_pos - 1]) <= 127
-                    ):
-                        start_pos -= 1
-                    else:
-                        left_ok = False
-            if right_ok:
-                if end_pos >= max_len:
-                    right_ok = False
-                else:
-                    if text[end_pos + 1] not in self._stop_chars_right:
-                        # correcting Markdown matches
-                        if right_enclosure_pos is None and text[end_pos + 1] == ")":
-                            right_enclosure_pos = end_pos + 1
-                        end_pos += 1
-                    else:
-                        right_ok = False
-
-            if text[start_pos : start_pos + 3] == "://":
-                in_scheme = True
-
-        # correcting Markdown matches
-        if possible_markdown and right_enclosure_pos is not None:
-            end_pos = right_enclosure_pos
-
-        complete_url = text[start_pos : end_pos + 1].lstrip("/")
+        # For Markdown link is typical to have "](" these
+        # brackets next to each other without white space
+        possible_markdown = text.find("](", max(start_pos - 1, 0), tld_pos + 1) != -1
+        if possible_markdown:
+            # correcting Markdown matches
+            right_enclosure_pos = text.find(")", tld_pos + 1, end_pos + 1)
+            if right_enclosure_pos != -1:
+                end_pos = right_enclosure_pos
+
+        # URL should not start with slash, only positions are moved
+        # so the URL is sliced from text just once
+        url_start_pos = start_pos
+        while url_start_pos <= end_pos and text[url_start_pos] == "/":
+            url_start_pos += 1
         # remove last character from url
         # when it is allowed character right after TLD (e.g. dot, comma)
-        temp_tlds = {tld + c for c in self._after_tld_chars}
-        # get only dot+tld+one_char and compare
-        extended_tld = complete_url[len(complete_url) - len(tld) - 1 :]
-        if extended_tld in temp_tlds:
+        if (
+            url_start_pos <= end_pos
+            and text[end_pos] in self._after_tld_chars
             # We do not want to change found URL
-            if not extended_tld.endswith("/"):
-                complete_url = complete_url[:-1]
+            and text[end_pos] != "/"
+            and text.endswith(tld, url_start_pos, end_pos)
+        ):
+            end_pos -= 1
+
+        complete_url = text[url_start_pos : end_pos + 1]
 
         complete_url = self._split_markdown(complete_url, tld_pos - start_pos)
         complete_url = self._remove_enclosure_from_url(
@@ -538,13 +880,7 @@ class URLExtract(CacheFile):
 
         # search for enclosures before URL ignoring space character " "
         # when URL contains right enclosure character (issue #77)
-        enclosure_map = {
-            left_char: right_char for left_char, right_char in self._enclosure
-        }
-        if any(
-            enclosure in complete_url[tld_pos - start_pos :]
-            for enclosure in enclosure_map.values()
-        ):
+        if self._right_enclosures_re.search(complete_url, tld_pos - start_pos):
             enclosure_space_char = True
             enclosure_found = False
             tmp_start_pos = start_pos
@@ -553,7 +889,7 @@ class URLExtract(CacheFile):
                     break
                 if text[tmp_start_pos - 1] == " ":
                     tmp_start_pos -= 1
-                elif text[tmp_start_pos - 1] in enclosure_map.keys():
+                elif text[tmp_start_pos - 1] in self._enclosure_map:
                     tmp_start_pos -= 1
                     enclosure_found = True
                 else:
@@ -604,6 +940,56 @@ class URLExtract(CacheFile):
 
         return False
 
+    def _get_host(self, url: str) -> Tuple[str, str]:
+        """
+        Returns host of given URL as it is written in URL and normalized.
+
+        :param str url: URL from which we want to get host
+        :return: tuple of host as it is in URL and normalized host
+            (lowercase, decoded), empty strings when URL does not contain
+            valid host or when URL is email and emails are not extracted
+        :rtype: tuple(str, str)
+        """
+        url_host, host, is_email, email_has_other_parts = _split_host(url)
+
+        if is_email:
+            # do not collect emails
+            if not self._extract_email:
+                return "", ""
+            # if we want to extract email we have to be sure that it
+            # really is email -> given URL does not have other parts
+            if email_has_other_parts:
+                return "", ""
+
+        if host is None:
+            self._logger.info(
+                "Invalid host '%s'. " "If the host is valid report a bug.", url
+            )
+            return "", ""
+
+        return url_host, host
+
+    def _remember_failed_dns(self, host: str):
+        """
+        Remember host with failed DNS lookup, so it is not looked up again
+        for DNS_NEGATIVE_CACHE_TTL seconds. Expired hosts are removed when
+        the cache is full and then the oldest ones if it is still full.
+
+        :param str host: host which could not be resolved
+        """
+        cache = self._dns_negative_cache
+        if len(cache) >= DNS_NEGATIVE_CACHE_SIZE:
+            now = time.monotonic()
+            # copy of items, the cache can be changed by other threads
+            for cached_host, failed_at in list(cache.items()):
+                if now - failed_at >= DNS_NEGATIVE_CACHE_TTL:
+                    cache.pop(cached_host, None)
+            # hosts are in order of insertion, remove the oldest ones
+            for cached_host in list(cache)[: len(cache) - DNS_NEGATIVE_CACHE_SIZE + 1]:
+                cache.pop(cached_host, None)
+
+        cache[host] = time.monotonic()
+
     def _is_domain_valid(
         self, url: str, tld: str, check_dns=False, with_schema_only=False
     ):
@@ -647,55 +1033,18 @@ class URLExtract(CacheFile):
         if not url:
             return False
 
-        scheme_pos = url.find("://")
-        if scheme_pos == -1:
-            if with_schema_only:
-                return False
-            url = "http://" + url
-            added_schema = True
-        else:
-            added_schema = False
-
-        url_parts = uritools.urisplit(url)
-        # <scheme>://<authority>/<path>?<query>#<fragment>
-
-        # authority can't start with @
-        if url_parts.authority and url_parts.authority.startswith("@"):
-            return False
-
-        # if URI contains user info and schema was automatically added
-        # the url is probably an email
-        if url_parts.getuserinfo() and added_schema:
-            # do not collect emails
-            if not self._extract_email:
-                return False
-            else:
-                # if we want to extract email we have to be sure that it
-                # really is email -> given URL does not have other parts
-                if (
-                    url_parts.getport()
-                    or url_parts.getpath()
-                    or url_parts.getquery()
-                    or url_parts.getfragment()
-                ):
-                    return False
-
-        try:
-            host = url_parts.gethost()
-        except ValueError:
-            self._logger.info(
-                "Invalid host '%s'. " "If the host is valid report a bug.", url
-            )
+        if with_schema_only and url.find("://") == -1:
             return False
 
+        url_host, host = self._get_host(url)
         if not host:
             return False
 
         if not self.allow_mixed_case_hostname:
-            # we have to take url_parts.host instead of host variable because url_parts.host is not normalized
+            # we have to take url_host instead of host variable because url_host is not normalized
             if not (
-                all(s.islower() for s in url_parts.host if s.isalpha())
-                or all(s.isupper() for s in url_parts.host if s.isalpha())
+                all(s.islower() for s in url_host if s.isalpha())
+                or all(s.isupper() for s in url_host if s.isalpha())
             ):
                 return False
 
@@ -706,7 +1055,7 @@ class URLExtract(CacheFile):
             return False
 
         # IP address are valid hosts
-        is_ipv4 = isinstance(host, ipaddress.IPv4Address)
+        is_ipv4 = _IPV4_RE.match(host) is not None
         if is_ipv4:
             return True
 
@@ -722,8 +1071,9 @@ class URLExtract(CacheFile):
         if len(host_parts) <= 1:
             return False
 
+        # host is already lowercase, only matched TLD has to be normalized
         host_tld = "." + host_parts[-1]
-        if host_tld.lower() != tld.lower():
+        if host_tld != tld.lower():
             return False
 
         top = host_parts[-2]
@@ -736,8 +1086,20 @@ class URLExtract(CacheFile):
                 dns_cache_install()
                 self._cache_dns = False
 
+            # do not ask DNS again for recently failed host
+            failed_at = self._dns_negative_cache.get(host)
+            if failed_at is not None:
+                if time.monotonic() - failed_at < DNS_NEGATIVE_CACHE_TTL:
+                    return False
+                # other thread could have removed it already
+                self._dns_negative_cache.pop(host, None)
+
             try:
                 socket.gethostbyname(host)
+            except socket.gaierror as err:
+                self._logger.info("Unable to resolve address {}: {}".format(host, err))
+                self._remember_failed_dns(host)
+                return False
             except socket.herror as err:
                 if err.errno == 0:
                     self._logger.info(
@@ -745,6 +1107,7 @@ class URLExtract(CacheFile):
                     )
                 else:
                     self._logger.info(err)
+                self._remember_failed_dns(host)
                 return False
             except Exception as err:
                 self._logger.info(
@@ -767,45 +1130,46 @@ class URLExtract(CacheFile):
         :rtype: str
         """
 
-        enclosure_map = {
-            left_char: right_char for left_char, right_char in self._enclosure
-        }
-        # get position of most right left_char of enclosure pairs
-        left_pos = max(
-            [
-                text_url.rfind(left_char, 0, tld_pos)
-                for left_char in enclosure_map.keys()
-            ]
-        )
-        left_char = text_url[left_pos] if left_pos >= 0 else ""
-        right_char = enclosure_map.get(left_char, "")
-        # get count of left and right enclosure characters and
-        left_char_count = text_url[: left_pos + 1].count(left_char)
-        right_char_count = text_url[left_pos:].count(right_char)
-        # we want to find only pairs and ignore rest (more occurrences)
-        min_count = min(left_char_count, right_char_count)
-
-        right_pos = len(text_url) + 1
-        # find position of Nth occurrence of right enclosure character
-        for i in range(max(min_count, 1)):
-            right_pos = text_url[:right_pos].rfind(right_char)
-
-        if right_pos < 0 or right_pos < tld_pos:
-            right_pos = len(text_url)
-
-        new_url = text_url[left_pos + 1 : right_pos]
-        tld_pos -= left_pos + 1
-
-        # Get valid domain when we have input as: example.com)/path
-        # we assume that if there is enclosure character after TLD it is
-        # the end URL itself therefore we remove the rest
-        after_tld_pos = tld_pos + len(tld)
-        if after_tld_pos < len(new_url):
-            if new_url[after_tld_pos] in enclosure_map.values():
-                new_url_tmp = new_url[:after_tld_pos]
-                return self._remove_enclosure_from_url(new_url_tmp, tld_pos, tld)
-
-        return new_url
+        enclosure_map = self._enclosure_map
+        while True:
+            # get position of most right left_char of enclosure pairs
+            left_enclosure = self._last_left_enclosure_re.match(text_url, 0, tld_pos)
+            left_pos = left_enclosure.start(1) if left_enclosure else -1
+            if left_pos < 0:
+                # there is no enclosure around URL
+                new_url = text_url
+            else:
+                left_char = text_url[left_pos]
+                right_char = enclosure_map[left_char]
+                # get count of left and right enclosure characters and
+                left_char_count = text_url.count(left_char, 0, left_pos + 1)
+                right_char_count = text_url.count(right_char, left_pos)
+                # we want to find only pairs and ignore rest (more occurrences)
+                min_count = min(left_char_count, right_char_count)
+
+                right_pos = len(text_url) + 1
+                # find position of Nth occurrence of right enclosure character
+                for i in range(max(min_count, 1)):
+                    right_pos = text_url.rfind(right_char, 0, right_pos)
+
+                if right_pos < 0 or right_pos < tld_pos:
+                    right_pos = len(text_url)
+
+                new_url = text_url[left_pos + 1 : right_pos]
+                tld_pos -= left_pos + 1
+
+            # Get valid domain when we have input as: example.com)/path
+            # we assume that if there is enclosure character after TLD it is
+            # the end URL itself therefore we remove the rest
+            after_tld_pos = tld_pos + len(tld)
+            if (
+                after_tld_pos < len(new_url)
+                and new_url[after_tld_pos] in self._right_enclosures
+            ):
+                text_url = new_url[:after_tld_pos]
+                continue
+
+            return new_url
 
     @staticmethod
     def _split_markdown(text_url: str, tld_pos: int) -> str:
@@ -822,6 +1186,11 @@ class URLExtract(CacheFile):
         # Markdown url can looks like:
         # [http://example.com/](http://example.com/status/210)
 
+        # most URLs are not Markdown links, so check the most specific part first
+        middle_pos = text_url.rfind("](")
+        if middle_pos <= tld_pos:
+            return text_url
+
         left_bracket_pos = text_url.find("[")
         # subtract 3 because URL is never shorter than 3 characters
         if left_bracket_pos > tld_pos - 3:
@@ -831,30 +1200,7 @@ class URLExtract(CacheFile):
         if right_bracket_pos < tld_pos:
             return text_url
 
-        middle_pos = text_url.rfind("](")
-        if middle_pos > tld_pos:
-            return text_url[left_bracket_pos + 1 : middle_pos]
-        return text_url
-
-    @staticmethod
-    # TODO: fix DOC to accomodate to return value
-    def _get_tld_pos(url: str, tld: str) -> int:
-        """
-        Return position of TLD in hostname.
-
-        :param str url: URL in which TLD should be located
-        :param str tld: TLD we want ot find
-        :return:
-        """
-        tpm_url = "http://" + url if url.find("://") == -1 else url
-
-        url_parts = uritools.urisplit(tpm_url)
-        host = str(url_parts.gethost())
-        # `host` is always returned in lowercase,
-        # so make sure `url` & `tld` must also be lowercase,
-        # otherwise the `find()` may fail.
-        offset = url.lower().find(host)
-        return host.rfind(tld.lower()) + offset
+        return text_url[left_bracket_pos + 1 : middle_pos]
 
     # TODO: move type assertion to be Generator based
     # found https://stackoverflow.com/a/38423388/14669675
@@ -872,52 +1218,57 @@ class URLExtract(CacheFile):
         :yields: URL or URL with indices found in text or empty string if nothing was found
         :rtype: str|tuple(str, tuple(int, int))
         """
-        tld_pos = 0
-        matched_tlds = self._tlds_re.findall(text)
-
-        while matched_tlds:
-            tld = matched_tlds.pop(0)
-            tmp_text = text[tld_pos:]
-            offset = tld_pos
-            tld_pos = tmp_text.find(tld)
-            validated = self._validate_tld_match(text, tld, offset + tld_pos)
-            if tld_pos != -1 and validated:
-                tmp_url = self._complete_url(
-                    text,
-                    offset + tld_pos,
-                    tld,
-                    check_dns=check_dns,
-                    with_schema_only=with_schema_only,
-                )
+        # every TLD starts with dot except localhost,
+        # so there is no need to search text without them
+        if "." not in text and (
+            not self._extract_localhost or "localhost" not in text.lower()
+        ):
+            return
 
-                if tmp_url:
-                    # do not search for TLD in already extracted URL
-                    tld_pos_url = self._get_tld_pos(tmp_url, tld)
-                    # move cursor right after found TLD
-                    tld_pos += len(tld) + offset
-                    # move cursor after end of found URL
-                    rest_url = tmp_url[tld_pos_url + len(tld) :]
-                    tld_pos += len(rest_url)
-
-                    # remove all matched TLDs that were found in currently
-                    # extracted URL (tmp_url resp. rest_url)
-                    while matched_tlds:
-                        new_tld = matched_tlds[0]
-                        tmp_tld_pos_url = rest_url.find(new_tld)
-                        if tmp_tld_pos_url < 0:
-                            break
-                        rest_url = rest_url[tmp_tld_pos_url + len(new_tld) :]
-                        matched_tlds.pop(0)
-
-                    if get_indices:
-                        yield tmp_url, (tld_pos - len(tmp_url), tld_pos)
-                    else:
-                        yield tmp_url
+        self._update_changed_settings()
+        text_lower = text.lower()
 
-                    continue
+        # positions in lowercase text are the same as in original text only
+        # when no character was changed to more characters by lower()
+        if len(text_lower) == len(text):
+            tld_matches = self._tlds_lower_re.finditer(text_lower)
+        else:
+            tld_matches = self._get_tlds_re().finditer(text)
+
+        # end of last extracted URL, TLDs before it are already processed
+        url_end_pos = 0
+        for tld_match in tld_matches:
+            tld_pos = tld_match.start()
+            # do not search for TLD in already extracted URL
+            if tld_pos < url_end_pos:
+                continue
+
+            # TLD as it is written in original text
+            tld = text[tld_pos : tld_match.end()]
+            if not self._validate_tld_match(text, tld, tld_pos):
+                continue
+
+            tmp_url = self._complete_url(
+                text,
+                tld_pos,
+                tld,
+                check_dns=check_dns,
+                with_schema_only=with_schema_only,
+            )
+            if not tmp_url:
+                continue
 
-            # move cursor right after found TLD
-            tld_pos += len(tld) + offset
+            # found URL is part of text and contains matched TLD
+            url_start_pos = text.find(
+                tmp_url, max(0, tld_pos + len(tld) - len(tmp_url))
+            )
+            # move cursor after end of found URL
+            url_end_pos = url_start_pos + len(tmp_url)
+
+            if get_indices:
+                yield tmp_url, (url_end_pos - len(tmp_url), url_end_pos)
+            else:
+                yield tmp_url
 
     def find_urls(
         self,
@@ -943,6 +1294,48 @@ class URLExtract(CacheFile):
         :raises URLExtractError: Raised when count of found URLs reaches
             given limit. Processed URLs are returned in `data` argument.
         """
+        # results with DNS check are not cached, DNS records can change
+        if self._find_urls_cached is None or check_dns:
+            return self._find_urls(
+                text,
+                only_unique=only_unique,
+                check_dns=check_dns,
+                get_indices=get_indices,
+                with_schema_only=with_schema_only,
+            )
+
+        return list(
+            self._find_urls_cached(text, only_unique, get_indices, with_schema_only)
+        )
+
+    def _find_urls_tuple(
+        self, text: str, only_unique: bool, get_indices: bool, with_schema_only: bool
+    ) -> Tuple[Union[str, Tuple[str, Tuple[int, int]]], ...]:
+        """
+        Find all URLs in given text and return them as tuple, which can be
+        safely cached (see find_urls).
+        """
+        return tuple(
+            self._find_urls(
+                text,
+                only_unique=only_unique,
+                get_indices=get_indices,
+                with_schema_only=with_schema_only,
+            )
+        )
+
+    def _find_urls(
+        self,
+        text: str,
+        only_unique=False,
+        check_dns=False,
+        get_indices=False,
+        with_schema_only=False,
+    ) -> List[Union[str, Tuple[str, Tuple[int, int]]]]:
+        """
+        Find all URLs in given text, see find_urls for description
+        of parameters and return value.
+        """
         urls = self.gen_urls(
             text,
             check_dns=check_dns,
@@ -951,7 +1344,7 @@ class URLExtract(CacheFile):
         )
         if self._limit is None:
             if only_unique:
-                return list(OrderedDict.fromkeys(urls))
+                return list(dict.fromkeys(urls))
             return list(urls)
 
         result_urls: List[Union[str, Tuple[str, Tuple[int, int]]]] = []
@@ -971,7 +1364,174 @@ class URLExtract(CacheFile):
             url_count += 1
 
         if only_unique:
-            return list(OrderedDict.fromkeys(result_urls))
+            return list(dict.fromkeys(result_urls))
+        return result_urls
+
+    def clear_urls_cache(self):
+        """
+        Clear cached results of find_urls.
+
+        Cache is cleared automatically when settings are changed by setters
+        of this object. Call it yourself when you modify sets returned
+        by getters in place, or when you change enclosures in other
+        URLExtract object (enclosures are shared by all objects).
+        """
+        if self._find_urls_cached is not None:
+            self._find_urls_cached.cache_clear()
+
+    def find_urls_batch(
+        self,
+        texts: Iterable[str],
+        only_unique=False,
+        check_dns=False,
+        get_indices=False,
+        with_schema_only=False,
+        workers=1,
+    ) -> List[List[Union[str, Tuple[str, Tuple[int, int]]]]]:
+        """
+        Find all URLs in each of given texts.
+
+        Texts are processed in threads when workers is greater than 1.
+        This helps mainly with check_dns, where most of the time is spent
+        waiting for DNS, not in Python code.
+
+        :param texts: texts where we want to find URLs
+        :param bool only_unique: return only unique URLs
+        :param bool check_dns: filter results to valid domains
+        :param bool get_indices: whether to return beginning and
+            ending indices as (<url>, (idx_begin, idx_end))
+        :param bool with_schema_only: get domains with schema only
+            (e.g. https://janlipovsky.cz but not example.com)
+        :param int workers: number of threads used for processing texts
+        :return: list of lists of URLs found in texts (in order of texts)
+        :rtype: list(list)
+
+        :raises URLExtractError: Raised when count of URLs found in one text
+            reaches given limit. Processed URLs are returned in `data` argument.
+        """
+        find_urls_in_text = functools.partial(
+            self.find_urls,
+            only_unique=only_unique,
+            check_dns=check_dns,
+            get_indices=get_indices,
+            with_schema_only=with_schema_only,
+        )
+        if workers <= 1:
+            return [find_urls_in_text(text) for text in texts]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(find_urls_in_text, texts))
+
+    def _split_text(self, text: str, chunk_size: int) -> List[Tuple[int, str]]:
+        """
+        Split text to chunks of whole lines with about chunk_size characters.
+        Text is not split when URL could continue on next line
+        with current stop characters or enclosures.
+
+        :param str text: text that we want to split
+        :param int chunk_size: minimal size of chunk (except the last one)
+        :return: list of tuples (position of chunk in text, chunk)
+        :rtype: list(tuple(int, str))
+        """
+        self._update_changed_settings()
+        if (
+            "\n" not in self._stop_chars_left
+            or "\n" not in self._stop_chars_left_from_schema
+            or "\n" not in self._stop_chars_right
+            or "\n" in self._enclosure_map
+        ):
+            return [(0, text)]
+
+        chunks = []
+        start = 0
+        while start < len(text):
+            end = text.find("\n", start + chunk_size)
+            end = len(text) if end == -1 else end + 1
+            chunks.append((start, text[start:end]))
+            start = end
+
+        return chunks
+
+    def find_urls_parallel(
+        self,
+        text: str,
+        only_unique=False,
+        check_dns=False,
+        get_indices=False,
+        with_schema_only=False,
+        workers: Optional[int] = None,
+        chunk_size=TEXT_CHUNK_SIZE,
+        mp_context=None,
+    ) -> List[Union[str, Tuple[str, Tuple[int, int]]]]:
+        """
+        Find all URLs in given text using more processes.
+        Returns the same result as find_urls().
+
+        Text is split to chunks of whole lines, which are processed
+        in separate processes. This pays off only for large texts,
+        because this object has to be copied to every process.
+
+        :param str text: text where we want to find URLs
+        :param bool only_unique: return only unique URLs
+        :param bool check_dns: filter results to valid domains
+        :param bool get_indices: whether to return beginning and
+            ending indices as (<url>, (idx_begin, idx_end))
+        :param bool with_schema_only: get domains with schema only
+            (e.g. https://janlipovsky.cz but not example.com)
+        :param int workers: number of processes,
+            default is number of processors on the machine
+        :param int chunk_size: approximate size of text processed at once
+        :param mp_context: multiprocessing context used for starting
+            processes, see concurrent.futures.ProcessPoolExecutor
+        :return: list of URLs found in text
+        :rtype: list
+        :raises URLExtractError: Raised when count of URLs reaches given limit.
+            Processed URLs are returned in `data` argument.
+        """
+        chunks = self._split_text(text, chunk_size)
+        if len(chunks) <= 1 or workers == 1:
+            return self.find_urls(
+                text,
+                only_unique=only_unique,
+                check_dns=check_dns,
+                get_indices=get_indices,
+                with_schema_only=with_schema_only,
+            )
+
+        # imported here, multiprocessing is not needed by most of users
+        from concurrent.futures import ProcessPoolExecutor
+
+        find_urls_in_chunk = functools.partial(
+            _find_urls_in_chunk, check_dns=check_dns, with_schema_only=with_schema_only
+        )
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            futures = [executor.submit(find_urls_in_chunk, chunk) for chunk in chunks]
+
+            result_urls: List[Union[str, Tuple[str, Tuple[int, int]]]] = []
+            for future in futures:
+                for url, indices in future.result():
+                    if self._limit is not None and len(result_urls) >= self._limit:
+                        err = "Limit for extracting URLs was reached. [{} URLs]".format(
+                            self._limit
+                        )
+                        self._logger.error(err)
+                        # do not wait for chunks which were not processed yet
+                        for not_done in futures:
+                            not_done.cancel()
+
+                        raise URLExtractError(err, data=result_urls)
+
+                    result_urls.append((url, indices) if get_indices else url)
+
+        if only_unique:
+            return list(dict.fromkeys(result_urls))
         return result_urls
 
     def has_urls(self, text: str, check_dns=False, with_schema_only=False) -> bool:
@@ -991,6 +1551,89 @@ class URLExtract(CacheFile):
         )
 
 
+def get_default_extractor() -> URLExtract:
+    """
+    Returns URLExtract instance shared within the process.
+    It is created on first call with default settings.
+
+    Creating URLExtract is not cheap (TLDs are loaded from cache file),
+    so use this one when you do not need any custom configuration.
+    Keep in mind that changes made to returned object (e.g. ignore list)
+    affect everyone else who uses it.
+
+    :return: shared URLExtract object
+    :rtype: URLExtract
+    """
+    global _DEFAULT_EXTRACTOR
+    if _DEFAULT_EXTRACTOR is None:
+        _DEFAULT_EXTRACTOR = URLExtract()
+    return _DEFAULT_EXTRACTOR
+
+
+def _init_worker(extractor: URLExtract):
+    """
+    Set URLExtract object used in worker process of find_urls_parallel.
+
+    :param URLExtract extractor: copy of object from parent process
+    """
+    global _WORKER_EXTRACTOR
+    _WORKER_EXTRACTOR = extractor
+
+
+def _find_urls_in_chunk(
+    chunk: Tuple[int, str], check_dns=False, with_schema_only=False
+) -> List[Tuple[str, Tuple[int, int]]]:
+    """
+    Find all URLs in text chunk using URLExtract object of worker process.
+
+    :param tuple chunk: position of chunk in whole text and the chunk
+    :param bool check_dns: filter results to valid domains
+    :param bool with_schema_only: get domains with schema only
+    :return: list of URLs with indices in whole text
+    :rtype: list(tuple(str, tuple(int, int)))
+    """
+    assert _WORKER_EXTRACTOR is not None, "Worker process was not initialized"
+    offset, text = chunk
+    urls_with_indices = _WORKER_EXTRACTOR.gen_urls(
+        text, check_dns=check_dns, get_indices=True, with_schema_only=with_schema_only
+    )
+    urls = []
+    for url, (start, end) in cast(
+        Iterable[Tuple[str, Tuple[int, int]]], urls_with_indices
+    ):
+        urls.append((url, (start + offset, end + offset)))
+    return urls
+
+
+def find_urls(
+    text: str,
+    only_unique=False,
+    check_dns=False,
+    get_indices=False,
+    with_schema_only=False,
+) -> List[Union[str, Tuple[str, Tuple[int, int]]]]:
+    """
+    Find all URLs in given text using shared URLExtract object.
+    See :func:`get_default_extractor` and :func:`URLExtract.find_urls`.
+
+    :param str text: text where we want to find URLs
+    :param bool only_unique: return only unique URLs
+    :param bool check_dns: filter results to valid domains
+    :param bool get_indices: whether to return beginning and
+        ending indices as (<url>, (idx_begin, idx_end))
+    :param bool with_schema_only: get domains with schema only
+    :return: list of URLs found in text
+    :rtype: list
+    """
+    return get_default_extractor().find_urls(
+        text,
+        only_unique=only_unique,
+        check_dns=check_dns,
+        get_indices=get_indices,
+        with_schema_only=with_schema_only,
+    )
+
+
 class URLExtractError(Exception):
     """
     Raised when some error occurred during processing URLs.
@@ -1036,7 +1679,7 @@ def _urlextract_cli():
     import argparse
 
     # TODO: add type checking here
-    def get_args() -> Namespace:
+    def get_args() -> argparse.Namespace:
         """Parse programs arguments"""
         parser = argparse.ArgumentParser(
             description="urlextract - prints out all URLs that were "
@@ -1135,16 +1778,36 @@ def _urlextract_cli():
         if args.permit_file:
             urlextract.load_permit_list(args.permit_file)
         urlextract.update_when_older(30)
-        content = args.input_file.read()
-        try:
-            for url in urlextract.find_urls(content, args.unique, args.check_dns):
-                print(url)
-        except URLExtractError as e:
-            logger.error(
-                "You can set limit using --limit parameter. "
-                "See --help for more details."
-            )
-            for url in e.data:
+
+        # URL can not contain new line, so input is processed in chunks
+        # of whole lines and it does not have to be read into memory at once
+        def gen_chunks() -> Generator[str, None, None]:
+            while True:
+                lines = args.input_file.readlines(TEXT_CHUNK_SIZE)
+                if not lines:
+                    return
+                yield "".join(lines)
+
+        found_urls = set()
+        url_count = 0
+        for chunk in gen_chunks():
+            for url in urlextract.gen_urls(chunk, check_dns=args.check_dns):
+                url_count += 1
+                if limit is not None and url_count > limit:
+                    logger.error(
+                        "Limit for extracting URLs was reached. "
+                        "[{} URLs]".format(limit)
+                    )
+                    logger.error(
+                        "You can set limit using --limit parameter. "
+                        "See --help for more details."
+                    )
+                    return
+
+                if args.unique:
+                    if url in found_urls:
+                        continue
+                    found_urls.add(url)
                 print(url)
 
     except CacheFileError as e:
@@ -1154,38 +1817,57 @@ def _urlextract_cli():
         args.input_file.close()
 
 
-def dns_cache_install() -> None:
+@functools.lru_cache(maxsize=None)
+def _import_dns_resolvers() -> Tuple:
+    """
+    Imports dnspython resolver module and ExceptionCachingResolver class
+    from dns_cache. Import is done only once, the result is cached.
+
+    :return: tuple of resolver module and ExceptionCachingResolver class,
+        None is returned instead of those that are not installed
+    :rtype: tuple(module|None, type|None)
+    """
     try:
         from dns import resolver as dnspython_resolver_module  # type: ignore
-        from dns_cache.resolver import ExceptionCachingResolver  # type: ignore
-
-        if not dnspython_resolver_module.default_resolver:
-            dnspython_resolver_module.default_resolver = ExceptionCachingResolver()
-        del dnspython_resolver_module
     except ImportError:
-        pass
+        return None, None
 
     try:
-        from dns.resolver import (  # type: ignore
-            LRUCache,
-            Resolver,
-            _resolver,
-            default_resolver,
-            override_system_resolver,
-        )
+        from dns_cache.resolver import ExceptionCachingResolver  # type: ignore
     except ImportError:
+        ExceptionCachingResolver = None
+
+    return dnspython_resolver_module, ExceptionCachingResolver
+
+
+def dns_cache_install() -> None:
+    dnspython_resolver_module, ExceptionCachingResolver = _import_dns_resolvers()
+    if dnspython_resolver_module is None:
         return
 
+    if ExceptionCachingResolver and not dnspython_resolver_module.default_resolver:
+        dnspython_resolver_module.default_resolver = ExceptionCachingResolver()
+
+    # resolvers have to be read from module every time,
+    # because they can be changed from outside
+    default_resolver = dnspython_resolver_module.default_resolver
+    _resolver = dnspython_resolver_module._resolver
+
     if default_resolver:
         if not default_resolver.cache:
-            default_resolver.cache = LRUCache()
+            default_resolver.cache = dnspython_resolver_module.LRUCache()
         resolver = default_resolver
     elif _resolver and _resolver.cache:
         resolver = _resolver
     else:
-        resolver = Resolver()
-        resolver.cache = LRUCache()
-    override_system_resolver(resolver)
+        resolver = dnspython_resolver_module.Resolver()
+        resolver.cache = dnspython_resolver_module.LRUCache()
+
+    # system resolver is already overridden by this resolver
+    if resolver is _resolver:
+        return
+
+    dnspython_resolver_module.override_system_resolver(resolver)
 
 
 if __name__ == "__main__":